@@ -1,19 +1,23 @@
 # custom_components/molnus/__init__.py
 from __future__ import annotations
 
+import asyncio
+import gzip
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Tuple
+from collections import deque
+from datetime import datetime
+from functools import partial
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 import voluptuous as vol
 
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.event import async_track_time_interval
-from homeassistant.util.dt import utcnow
+from homeassistant.helpers.httpx_client import get_async_client
+from homeassistant.util.ssl import get_default_context
 
-from .const import DOMAIN, PLATFORMS, DEFAULT_SCAN_INTERVAL, LABELS
-from .client import MolnusClient, ImagesResponseSimple
+from .const import DOMAIN, PLATFORMS, LABELS, LABELS_SET
+from .client import MolnusClient, ImagesResponseSimple, SimplePrediction
 from .coordinator import MolnusCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -21,43 +25,69 @@ _LOGGER = logging.getLogger(__name__)
 # Try optional influx v2 client
 try:
     from influxdb_client import InfluxDBClient, Point, WritePrecision
-    from influxdb_client.client.write_api import SYNCHRONOUS
+    from influxdb_client.client.write_api import WriteOptions
 
     _INFLUX_V2_AVAILABLE = True
 except Exception:
     InfluxDBClient = None
     Point = None
     WritePrecision = None
-    SYNCHRONOUS = None
+    WriteOptions = None
     _INFLUX_V2_AVAILABLE = False
 
-# http client for Influx v1 writes
-import httpx  # kept here intentionally
+# Prefer the asyncio influx v2 client (needs aiohttp) so writes are awaited on the event loop
+try:
+    from influxdb_client.client.influxdb_client_async import InfluxDBClientAsync
+
+    _INFLUX_V2_ASYNC_AVAILABLE = True
+except Exception:
+    InfluxDBClientAsync = None
+    _INFLUX_V2_ASYNC_AVAILABLE = False
 
 # max history items stored in memory (sensor attributes)
 MAX_HISTORY_ITEMS = 500
 
-
-def _parse_iso_to_dt(iso: Optional[str]) -> Optional[datetime]:
-    """Parse ISO timestamp tolerant (handles trailing Z -> +00:00)."""
-    if not iso:
-        return None
-    try:
-        if iso.endswith("Z"):
-            iso2 = iso[:-1] + "+00:00"
-        else:
-            iso2 = iso
-        return datetime.fromisoformat(iso2)
-    except Exception:
-        try:
-            base = iso.split(".")[0].replace("Z", "")
-            return datetime.fromisoformat(base)
-        except Exception:
-            return None
+# all-zero label counts, copied into each entry at setup
+_EMPTY_LABEL_COUNTS = dict.fromkeys(LABELS, 0)
+
+# line-protocol escaping tables (single str.translate pass per value)
+_MEASUREMENT_TRANS = str.maketrans({" ": r"\ ", ",": r"\,"})
+_TAG_TRANS = str.maketrans({" ": r"\ ", ",": r"\,", "=": r"\="})
+_FIELD_TRANS = str.maketrans({'"': r'\"', "\\": r"\\"})
+
+# gzip Influx v1 write bodies at or above this size (bytes); smaller ones are sent raw
+INFLUX_GZIP_MIN_BYTES = 1024
+
+
+class InfluxConfig(NamedTuple):
+    """Influx settings read once from the config entry data."""
+
+    version: str
+    url: Optional[str]
+    token: Optional[str]
+    org: Optional[str]
+    bucket: Optional[str]
+    db: Optional[str]
+    user: Optional[str]
+    password: Optional[str]
+
+    @classmethod
+    def from_dict(cls, entry_data: Dict[str, Any]) -> "InfluxConfig":
+        return cls(
+            # prefer explicit version in entry_data
+            version=str(entry_data.get("influx_version", "2")).strip(),
+            url=entry_data.get("influx_url"),
+            token=entry_data.get("influx_token"),
+            org=entry_data.get("influx_org"),
+            bucket=entry_data.get("influx_bucket"),
+            db=entry_data.get("influx_db"),
+            user=entry_data.get("influx_user"),
+            password=entry_data.get("influx_password"),
+        )
 
 
 def _create_influx_client_if_configured(
-    stored: Dict[str, Any], entry_data: Dict[str, Any]
+    stored: Dict[str, Any], cfg: InfluxConfig
 ) -> Tuple[Optional[str], Optional[Any], Optional[Any], Optional[str], Optional[str]]:
     """
     Detect and create/cache Influx client/config for either v2 or v1.
@@ -67,74 +97,65 @@ def _create_influx_client_if_configured(
       ("v1", None, None, db, url) when v1 configured (params stored in stored["_influx_v1"])
       (None, None, None, None, None) when no Influx configured
     """
-    # prefer explicit version in entry_data
-    version = str(entry_data.get("influx_version", "2")).strip()
-
     # Try v2 if configured and available
-    if version != "1":
-        url = entry_data.get("influx_url")
-        token = entry_data.get("influx_token")
-        org = entry_data.get("influx_org")
-        bucket = entry_data.get("influx_bucket")
+    if cfg.version != "1":
+        url, token, org, bucket = cfg.url, cfg.token, cfg.org, cfg.bucket
         if url and token and org and bucket and _INFLUX_V2_AVAILABLE:
             # cache client in stored
             if stored.get("_influx_v2_client"):
                 return ("v2", stored.get("_influx_v2_client"), stored.get("_influx_v2_write_api"), bucket, org)
             try:
-                client = InfluxDBClient(url=url, token=token, org=org)
-                write_api = client.write_api(write_options=SYNCHRONOUS)
+                if _INFLUX_V2_ASYNC_AVAILABLE:
+                    # HA's preloaded SSL context: building a default one loads the CA store on the event loop
+                    client = InfluxDBClientAsync(url=url, token=token, org=org, ssl_context=get_default_context())
+                    write_api = client.write_api()
+                else:
+                    client = InfluxDBClient(url=url, token=token, org=org)
+                    # batching write_api: write() only enqueues, a background thread flushes
+                    write_api = client.write_api(
+                        write_options=WriteOptions(batch_size=500, flush_interval=2_000, jitter_interval=200, retry_interval=3_000)
+                    )
+                stored["_influx_v2_async"] = _INFLUX_V2_ASYNC_AVAILABLE
                 stored["_influx_v2_client"] = client
                 stored["_influx_v2_write_api"] = write_api
                 stored["_influx_v2_bucket"] = bucket
                 stored["_influx_v2_org"] = org
+                stored.pop("_influx_v2_retry", None)
                 _LOGGER.debug("Molnus: created InfluxDB v2 client for bucket %s", bucket)
                 return ("v2", client, write_api, bucket, org)
             except Exception:
                 _LOGGER.exception("Molnus: failed to create InfluxDB v2 client")
-                # fall through to v1 detection
+                # retried on the next fetch; fall through to v1 detection
+                stored["_influx_v2_retry"] = True
 
     # Try v1 (legacy)
-    url = entry_data.get("influx_url")
-    db = entry_data.get("influx_db")
-    user = entry_data.get("influx_user")
-    password = entry_data.get("influx_password")
+    url, db, user = cfg.url, cfg.db, cfg.user
     if url and db and user is not None:
         # cache v1 params in stored for reuse
-        stored["_influx_v1"] = {"url": url.rstrip("/"), "db": db, "user": user, "password": password or ""}
+        stored["_influx_v1"] = {"url": url.rstrip("/"), "db": db, "user": user, "password": cfg.password or ""}
         _LOGGER.debug("Molnus: configured InfluxDB v1 -> %s db=%s", url, db)
         return ("v1", None, None, db, url.rstrip("/"))
 
     return (None, None, None, None, None)
 
 
-async def _write_influx_v1(
-    stored: Dict[str, Any],
+def _build_influx_v1_line(
     measurement: str,
     tags: Dict[str, Any],
     fields: Dict[str, Any],
     ts_dt: Optional[datetime],
-) -> bool:
+) -> Optional[str]:
     """
-    Write a single point to InfluxDB v1 via HTTP line-protocol.
-    Returns True if success (HTTP 204/200), False otherwise.
+    Build a single InfluxDB v1 line-protocol line.
+    Returns None if there are no fields to write.
     """
-    params = stored.get("_influx_v1")
-    if not params:
-        return False
-
-    url = params["url"]
-    db = params["db"]
-    user = params["user"]
-    password = params["password"]
-
-    def _escape_tag(v: str) -> str:
-        return str(v).replace(" ", r"\ ").replace(",", r"\,").replace("=", r"\=")
 
+    # tags sorted by key so the server does not have to sort them
     tag_parts = []
-    for k, v in (tags or {}).items():
+    for k, v in sorted((tags or {}).items()):
         if v is None:
             continue
-        tag_parts.append(f"{k}={_escape_tag(v)}")
+        tag_parts.append(f"{k}={str(v).translate(_TAG_TRANS)}")
     tags_str = ",".join(tag_parts)
 
     field_parts = []
@@ -142,98 +163,297 @@ async def _write_influx_v1(
         if v is None:
             continue
         if isinstance(v, str):
-            fv = v.replace('"', r'\"')
+            fv = v.translate(_FIELD_TRANS)
             field_parts.append(f'{k}="{fv}"')
         elif isinstance(v, bool):
             field_parts.append(f"{k}={'true' if v else 'false'}")
+        elif isinstance(v, int):
+            # integer field (line-protocol "i" suffix)
+            field_parts.append(f"{k}={v}i")
+        elif isinstance(v, float):
+            field_parts.append(f"{k}={v}")
         else:
-            # numeric
+            # other numeric-like types, else written as string
             try:
                 field_parts.append(f"{k}={float(v)}")
-            except Exception:
-                field_parts.append(f'{k}="{str(v)}"')
+            except (TypeError, ValueError):
+                field_parts.append(f'{k}="{str(v).translate(_FIELD_TRANS)}"')
     fields_str = ",".join(field_parts)
     if not fields_str:
-        return False
+        return None
 
-    measurement_escaped = measurement.replace(" ", r"\ ")
-    line = measurement_escaped
-    if tags_str:
-        line += f",{tags_str}"
-    line += f" {fields_str}"
+    measurement_escaped = measurement.translate(_MEASUREMENT_TRANS)
+    tags_sep = "," if tags_str else ""
+    # captureDate has second resolution; written with precision=s
+    ts_str = f" {int(ts_dt.timestamp())}" if ts_dt else ""
 
-    if ts_dt:
-        ts_ns = int(ts_dt.timestamp() * 1_000_000_000)
-        line += f" {ts_ns}"
+    return f"{measurement_escaped}{tags_sep}{tags_str} {fields_str}{ts_str}"
 
-    write_url = f"{url}/write"
-    params_qs = {"db": db}
 
-    # Try reuse httpx.Client from MolnusClient if available
-    http_client = None
-    try:
-        molnus_client: MolnusClient = stored.get("client")
-        if molnus_client and hasattr(molnus_client, "_client"):
-            http_client = molnus_client._client  # httpx.AsyncClient
-    except Exception:
-        http_client = None
+async def _write_influx_v1(hass: HomeAssistant, stored: Dict[str, Any], lines: List[str]) -> bool:
+    """
+    Write a batch of line-protocol lines to InfluxDB v1 in a single HTTP request.
+    Returns True if success (HTTP 204/200), False otherwise.
+    """
+    params = stored.get("_influx_v1")
+    if not params or not lines:
+        return False
+
+    url = params["url"]
+    db = params["db"]
+    user = params["user"]
+    password = params["password"]
 
-    created_local = False
-    if http_client is None:
-        http_client = httpx.AsyncClient(timeout=10.0)
-        created_local = True
+    body = "\n".join(lines).encode("utf-8")
+    headers = {"Content-Type": "text/plain; charset=utf-8"}
+    if len(body) >= INFLUX_GZIP_MIN_BYTES:
+        body = gzip.compress(body)
+        headers["Content-Encoding"] = "gzip"
+    write_url = f"{url}/write"
+    params_qs = {"db": db, "precision": "s"}
+
+    # Home Assistant's shared pooled client; owned (and closed) by HA, not by this entry
+    http_client = get_async_client(hass)
 
     try:
-        resp = await http_client.post(write_url, params=params_qs, content=line, auth=(user, password) if user else None)
+        resp = await http_client.post(
+            write_url, params=params_qs, content=body, headers=headers, auth=(user, password) if user else None, timeout=10.0
+        )
         if resp.status_code in (204, 200):
             return True
-        _LOGGER.debug("Influx v1 write failed: %s %s -- line: %s", resp.status_code, resp.text, line)
+        _LOGGER.debug("Influx v1 write failed: %s %s -- %s lines", resp.status_code, resp.text, len(lines))
         return False
     except Exception:
         _LOGGER.exception("Failed to write to InfluxDB v1")
         return False
-    finally:
-        if created_local:
-            await http_client.aclose()
 
 
-async def _write_influx_point(
+async def _flush_influx(
+    hass: HomeAssistant,
     stored: Dict[str, Any],
     method_tuple: Tuple[Optional[str], Optional[Any], Optional[Any], Optional[str], Optional[str]],
-    top_label: str,
-    top_accuracy: Optional[float],
-    camera_id_local: str,
-    ts_dt: Optional[datetime],
-) -> None:
+    points: List[Tuple[Optional[str], Optional[float], str, Optional[datetime]]],
+) -> bool:
     """
-    High-level writer that routes to v2 or v1 accordingly.
+    Write all collected points in one request, routed to v2 or v1 accordingly.
     method_tuple is returned by _create_influx_client_if_configured.
+    points is a list of (top_label, top_accuracy, camera_id, ts_dt) tuples.
+    Returns False if the write failed (the points should be sent again), True otherwise.
     """
-    if not method_tuple or method_tuple[0] is None:
-        return
+    if not method_tuple or method_tuple[0] is None or not points:
+        return True
 
     kind = method_tuple[0]
     if kind == "v2":
         # v2 usage
         _, client, write_api, bucket, org = method_tuple
         if not write_api:
-            return
+            return False
+        records = []
+        # loop-invariant lookups hoisted into locals
+        point_cls, precision, append = Point, WritePrecision.S, records.append
+        for top_label, top_accuracy, camera_id_local, ts_dt in points:
+            try:
+                p = point_cls("molnus_image").tag("camera_id", camera_id_local).tag("species", top_label).field(
+                    "accuracy", float(top_accuracy) if top_accuracy is not None else 0.0
+                )
+                if ts_dt:
+                    p = p.time(ts_dt, precision)
+                append(p)
+            except Exception:
+                _LOGGER.exception("Failed to build InfluxDB v2 point for image %s", ts_dt)
+        if not records:
+            return True
         try:
-            p = Point("molnus_image").tag("species", top_label).tag("camera_id", camera_id_local).field(
-                "accuracy", float(top_accuracy) if top_accuracy is not None else 0.0
-            )
-            if ts_dt:
-                p = p.time(ts_dt, WritePrecision.NS)
-            # Write synchronously (blocking small amount)
-            write_api.write(bucket=bucket, org=org, record=p)
+            if stored.get("_influx_v2_async"):
+                # pass the precision explicitly: older WriteApiAsync releases ignore the points' own
+                await write_api.write(bucket=bucket, org=org, record=records, write_precision=precision)
+            else:
+                # write() serializes the points before enqueueing them; keep that off the event loop
+                await hass.async_add_executor_job(
+                    partial(write_api.write, bucket=bucket, org=org, record=records, write_precision=precision)
+                )
         except Exception:
-            _LOGGER.exception("Failed to write point to InfluxDB v2")
+            _LOGGER.exception("Failed to write %s points to InfluxDB v2", len(records))
+            return False
+        return True
     elif kind == "v1":
         # write via http
+        lines = []
+        for top_label, top_accuracy, camera_id_local, ts_dt in points:
+            line = _build_influx_v1_line(
+                "molnus_image",
+                {"species": top_label, "camera_id": camera_id_local},
+                {"accuracy": float(top_accuracy) if top_accuracy is not None else 0.0},
+                ts_dt,
+            )
+            if line:
+                lines.append(line)
+        if not lines:
+            return True
         try:
-            await _write_influx_v1(stored, "molnus_image", {"species": top_label, "camera_id": camera_id_local}, {"accuracy": float(top_accuracy) if top_accuracy is not None else 0.0}, ts_dt)
+            return await _write_influx_v1(hass, stored, lines)
         except Exception:
-            _LOGGER.exception("Failed to write point to InfluxDB v1")
+            _LOGGER.exception("Failed to write %s points to InfluxDB v1", len(lines))
+            return False
+    return True
+
+
+def _pick_top(predictions: List[SimplePrediction]) -> Tuple[Optional[str], Optional[int]]:
+    """Return (label, accuracy) of the most accurate labelled prediction, or (None, None)."""
+    top = max(
+        (p for p in predictions if p and p.label is not None),
+        key=lambda p: p.accuracy if p.accuracy is not None else -1,
+        default=None,
+    )
+    return (top.label, top.accuracy) if top else (None, None)
+
+
+async def _process_images(
+    hass: HomeAssistant,
+    stored_local: Dict[str, Any],
+    camera_id_local: str,
+    images_resp: ImagesResponseSimple,
+) -> int:
+    """
+    Process a fetched batch of images: update history and label counts
+    and write to Influx (if configured).
+    Returns the number of images in the batch.
+    """
+    stored_local["last_images"] = images_resp
+    stored_local["last_images_count"] = len(images_resp.images) if images_resp and images_resp.images else 0
+
+    found_labels = set()
+    influx_points = []
+    history = stored_local["history"]
+    # captureDates currently in history, kept in sync for O(1) duplicate checks
+    history_dates = stored_local["history_dates"]
+    newest_before = history[0]["captureDate"] if history else None
+
+    # method (v2 or v1) resolved once in async_setup_entry, re-resolved only if v2 setup failed
+    if stored_local.get("_influx_v2_retry"):
+        stored_local["_influx_method"] = _create_influx_client_if_configured(stored_local, stored_local["_influx_cfg"])
+    method_tuple = stored_local.get("_influx_method")
+    write_influx = bool(method_tuple and method_tuple[0])
+    add_point = influx_points.append
+    # (camera_id, captureDate) already written to Influx; the service may fetch any camera
+    influx_written = stored_local["influx_written"]
+    influx_keys = []
+
+    for img in images_resp.images:
+        top_label, top_accuracy = _pick_top(img.predictions)
+        if top_label:
+            found_labels.add(top_label)
+
+        capture_date = img.captureDateRaw
+        if capture_date and capture_date not in history_dates:
+            if len(history) == history.maxlen:
+                # appendleft evicts the oldest entry; forget its date too
+                history_dates.discard(history[-1]["captureDate"])
+            # the API's ISO string as-is; the parsed datetime is only needed for Influx
+            history.appendleft(
+                {
+                    "captureDate": capture_date,
+                    "url": img.url,
+                    "label": top_label,
+                    "accuracy": top_accuracy,
+                }
+            )
+            history_dates.add(capture_date)
+
+        # collect point for a single batched influx write (v2 or v1)
+        if write_influx:
+            key = (camera_id_local, capture_date)
+            if capture_date and key in influx_written:
+                continue
+            add_point((top_label, top_accuracy, camera_id_local, img.captureDate))
+            if capture_date:
+                influx_keys.append(key)
+
+    if history and history[0]["captureDate"] != newest_before:
+        # immutable snapshot for the sensors, rebuilt only when new entries were added
+        stored_local["history_view"] = tuple(history)
+
+    try:
+        written = await _flush_influx(hass, stored_local, method_tuple, influx_points)
+    except Exception:
+        _LOGGER.exception("Error while writing %s points to Influx", len(influx_points))
+        written = False
+    if written:
+        # remember only points that reached Influx; a failed batch is sent again on the next fetch
+        influx_order = stored_local["influx_written_order"]
+        for key in influx_keys:
+            if len(influx_order) == influx_order.maxlen:
+                influx_written.discard(influx_order[0])
+            influx_order.append(key)
+            influx_written.add(key)
+
+    # only flip the labels whose presence changed since the previous fetch
+    present = found_labels & LABELS_SET
+    previous = stored_local["present_labels"]
+    label_counts = stored_local["label_counts"]
+    for label in previous - present:
+        label_counts[label] = 0
+    for label in present - previous:
+        label_counts[label] = 1
+    stored_local["present_labels"] = present
+
+    return stored_local["last_images_count"]
+
+
+async def _fetch_and_process(
+    hass: HomeAssistant,
+    stored_local: Dict[str, Any],
+    camera_id_local: str,
+    offset: int = 0,
+    limit: int = 50,
+    wildlife_required: bool = False,
+) -> int:
+    """
+    Fetch images for a camera and process them.
+    Shared by the fetch_images service and the periodic auto-fetch; the per-entry
+    lock keeps the two from processing (and writing to Influx) concurrently.
+    Returns the number of images fetched; errors from get_images propagate.
+    """
+    async with stored_local["_fetch_lock"]:
+        client_local: MolnusClient = stored_local["client"]
+        images_resp: ImagesResponseSimple = await client_local.get_images(
+            camera_id=camera_id_local, offset=offset, limit=limit, wildlife_required=wildlife_required
+        )
+        return await _process_images(hass, stored_local, camera_id_local, images_resp)
+
+
+def _coordinator_data(stored: Dict[str, Any]) -> Dict[str, Any]:
+    """Snapshot of the entry state handed to sensors via the coordinator."""
+    return {
+        "history": stored["history_view"],
+        "label_counts": stored["label_counts"],
+        "last_images_count": stored["last_images_count"],
+    }
+
+
+async def _async_close_stored(hass: HomeAssistant, stored: Dict[str, Any]) -> None:
+    """Flush and close the Influx and Molnus clients held by an entry."""
+    stored.pop("_influx_method", None)
+    # flush pending batches, then close influx v2 client if exists
+    write_api = stored.get("_influx_v2_write_api")
+    try:
+        if write_api and not stored.get("_influx_v2_async"):
+            # close() blocks until pending batches are flushed
+            await hass.async_add_executor_job(write_api.close)
+    except Exception:
+        _LOGGER.exception("Failed to flush Influx v2 write api")
+    influx_client = stored.get("_influx_v2_client")
+    try:
+        if influx_client and stored.get("_influx_v2_async"):
+            await influx_client.close()
+        elif influx_client:
+            influx_client.close()
+    except Exception:
+        _LOGGER.exception("Failed to close Influx v2 client")
+    client = stored.get("client")
+    if client:
+        await client.close()
 
 
 async def async_setup(hass: HomeAssistant, config: Dict[str, Any]) -> bool:
@@ -249,26 +469,55 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     interval_hours = int(data.get("auto_fetch_interval_hours", 1))
     interval_seconds = max(60, interval_hours * 3600)
 
-    client = MolnusClient(email=email, password=password)
-    coordinator = MolnusCoordinator(hass, client, DEFAULT_SCAN_INTERVAL)
-
-    # Validate login
-    await coordinator.async_config_entry_first_refresh()
+    # share Home Assistant's pooled httpx client (keep-alive, TLS session reuse)
+    client = MolnusClient(email=email, password=password, client=get_async_client(hass))
 
     hass.data[DOMAIN].setdefault(entry.entry_id, {})
     stored = hass.data[DOMAIN][entry.entry_id]
     stored["client"] = client
-    stored["coordinator"] = coordinator
     stored["last_images"] = None
     stored["last_images_count"] = 0
-    stored["history"] = []
-    stored["label_counts"] = {label: 0 for label in LABELS.keys()}
-    stored["label_sensors"] = []
-    stored["other_sensors"] = []
-    stored["_entry_data"] = data
+    # newest first; the bounded deque drops the oldest entries beyond MAX_HISTORY_ITEMS
+    stored["history"] = deque(maxlen=MAX_HISTORY_ITEMS)
+    stored["history_dates"] = set()
+    stored["history_view"] = ()
+    # bounded like history: oldest keys are forgotten first
+    stored["influx_written"] = set()
+    stored["influx_written_order"] = deque(maxlen=MAX_HISTORY_ITEMS)
+    stored["label_counts"] = dict(_EMPTY_LABEL_COUNTS)
+    stored["present_labels"] = set()
+    stored["_fetch_lock"] = asyncio.Lock()
 
     # Prepare influx config (v1 caching happens inside _create_influx_client_if_configured)
-    _create_influx_client_if_configured(stored, data)
+    stored["_influx_cfg"] = InfluxConfig.from_dict(data)
+    stored["_influx_method"] = _create_influx_client_if_configured(stored, stored["_influx_cfg"])
+
+    async def _async_update() -> Dict[str, Any]:
+        if camera_id:
+            _LOGGER.debug("Auto-fetch: fetching images for camera %s", camera_id)
+            history = stored["history"]
+            newest_before = history[0]["captureDate"] if history else None
+            count = await _fetch_and_process(hass, stored, camera_id)
+            # poll faster right after new images, back off to the configured interval otherwise
+            coordinator.adjust_interval((history[0]["captureDate"] if history else None) != newest_before)
+            _LOGGER.info("Molnus: auto-fetched %s images for camera %s", count, camera_id)
+        else:
+            # no camera configured: only validate credentials / connectivity
+            await client.login()
+        return _coordinator_data(stored)
+
+    # the coordinator runs the periodic auto-fetch and fans the result out to the sensors;
+    # without a camera there is nothing to poll, credentials are validated by the first refresh only
+    coordinator = MolnusCoordinator(hass, interval_seconds if camera_id else None, update_method=_async_update)
+    stored["coordinator"] = coordinator
+
+    # Validate login (and run the first fetch)
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await _async_close_stored(hass, stored)
+        raise
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -310,180 +559,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             wildlife_required = call.data.get("wildlife_required", False)
 
             try:
-                images_resp: ImagesResponseSimple = await client_local.get_images(
-                    camera_id=camera_id_local, offset=offset, limit=limit, wildlife_required=wildlife_required
+                count = await _fetch_and_process(
+                    hass, stored_local, camera_id_local, offset=offset, limit=limit, wildlife_required=wildlife_required
                 )
             except Exception as e:
                 _LOGGER.exception("Failed to fetch images: %s", e)
                 return
 
-            stored_local["last_images"] = images_resp
-            stored_local["last_images_count"] = len(images_resp.images) if images_resp and images_resp.images else 0
-
-            found_labels = set()
-
-            # determine method (v2 or v1)
-            method_tuple = _create_influx_client_if_configured(stored_local, stored_local.get("_entry_data", {}))
-
-            for img in images_resp.images:
-                top_label = None
-                top_accuracy = None
-                if img.predictions:
-                    sorted_preds = sorted(
-                        [p for p in img.predictions if p and p.label is not None],
-                        key=lambda x: (x.accuracy if x.accuracy is not None else -1),
-                        reverse=True,
-                    )
-                    if sorted_preds:
-                        top_label = sorted_preds[0].label
-                        top_accuracy = sorted_preds[0].accuracy
-
-                entry_obj = {
-                    "captureDate": img.captureDate.isoformat() if img.captureDate else None,
-                    "url": img.url,
-                    "label": top_label,
-                    "accuracy": top_accuracy,
-                }
-                if entry_obj["captureDate"] not in [h.get("captureDate") for h in stored_local["history"]]:
-                    stored_local["history"].insert(0, entry_obj)
-
-                if top_label:
-                    found_labels.add(top_label)
-
-                # write to influx (v2 or v1) non-blocking in async context
-                if method_tuple and method_tuple[0]:
-                    ts = _parse_iso_to_dt(entry_obj["captureDate"]) if entry_obj.get("captureDate") else None
-                    try:
-                        await _write_influx_point(stored_local, method_tuple, top_label, top_accuracy, camera_id_local, ts)
-                    except Exception:
-                        _LOGGER.exception("Error while writing to Influx for image %s", entry_obj.get("captureDate"))
-
-            # trim history
-            if len(stored_local["history"]) > MAX_HISTORY_ITEMS:
-                stored_local["history"] = stored_local["history"][:MAX_HISTORY_ITEMS]
-
-            for label in LABELS.keys():
-                stored_local["label_counts"][label] = 1 if label in found_labels else 0
-
-            # update sensors
-            for sensor in stored_local.get("label_sensors", []):
-                try:
-                    sensor.async_write_ha_state()
-                except Exception:
-                    _LOGGER.exception("Failed to update label sensor state")
-            for sensor in stored_local.get("other_sensors", []):
-                try:
-                    sensor.async_write_ha_state()
-                except Exception:
-                    _LOGGER.exception("Failed to update other sensor state")
-
-            _LOGGER.info("Molnus: fetched %s images for camera %s", stored_local.get("last_images_count"), camera_id_local)
+            stored_local["coordinator"].async_set_updated_data(_coordinator_data(stored_local))
+            _LOGGER.info("Molnus: fetched %s images for camera %s", count, camera_id_local)
 
         hass.services.async_register(DOMAIN, "fetch_images", handle_fetch_images, schema=schema)
         hass.data[DOMAIN]["service_registered"] = True
 
-    # Auto-fetch
-    if camera_id:
-        async def _auto_fetch(now):
-            try:
-                stored_local = hass.data[DOMAIN].get(entry.entry_id)
-                if not stored_local:
-                    _LOGGER.error("Auto-fetch: entry not found %s", entry.entry_id)
-                    return
-                client_local: MolnusClient = stored_local.get("client")
-                if not client_local:
-                    _LOGGER.error("Auto-fetch: no client for entry %s", entry.entry_id)
-                    return
-
-                _LOGGER.debug("Auto-fetch: fetching images for camera %s", camera_id)
-                images_resp = await client_local.get_images(camera_id=camera_id, offset=0, limit=50, wildlife_required=False)
-                stored_local["last_images"] = images_resp
-                stored_local["last_images_count"] = len(images_resp.images) if images_resp and images_resp.images else 0
-
-                found_labels = set()
-                method_tuple = _create_influx_client_if_configured(stored_local, stored_local.get("_entry_data", {}))
-
-                for img in images_resp.images:
-                    top_label = None
-                    top_accuracy = None
-                    if img.predictions:
-                        sorted_preds = sorted(
-                            [p for p in img.predictions if p and p.label is not None],
-                            key=lambda x: (x.accuracy if x.accuracy is not None else -1),
-                            reverse=True,
-                        )
-                        if sorted_preds:
-                            top_label = sorted_preds[0].label
-                            top_accuracy = sorted_preds[0].accuracy
-
-                    entry_obj = {
-                        "captureDate": img.captureDate.isoformat() if img.captureDate else None,
-                        "url": img.url,
-                        "label": top_label,
-                        "accuracy": top_accuracy,
-                    }
-                    if entry_obj["captureDate"] not in [h.get("captureDate") for h in stored_local["history"]]:
-                        stored_local["history"].insert(0, entry_obj)
-
-                    if top_label:
-                        found_labels.add(top_label)
-
-                    if method_tuple and method_tuple[0]:
-                        ts = _parse_iso_to_dt(entry_obj["captureDate"]) if entry_obj.get("captureDate") else None
-                        try:
-                            await _write_influx_point(stored_local, method_tuple, top_label, top_accuracy, camera_id, ts)
-                        except Exception:
-                            _LOGGER.exception("Error while writing to Influx for image %s", entry_obj.get("captureDate"))
-
-                if len(stored_local["history"]) > MAX_HISTORY_ITEMS:
-                    stored_local["history"] = stored_local["history"][:MAX_HISTORY_ITEMS]
-
-                for label in LABELS.keys():
-                    stored_local["label_counts"][label] = 1 if label in found_labels else 0
-
-                for sensor in stored_local.get("label_sensors", []):
-                    try:
-                        sensor.async_write_ha_state()
-                    except Exception:
-                        _LOGGER.exception("Failed to update label sensor state")
-                for sensor in stored_local.get("other_sensors", []):
-                    try:
-                        sensor.async_write_ha_state()
-                    except Exception:
-                        _LOGGER.exception("Failed to update other sensor state")
-
-                _LOGGER.info("Molnus: auto-fetched %s images for camera %s", stored_local.get("last_images_count"), camera_id)
-            except Exception:
-                _LOGGER.exception("Auto-fetch failed")
-
-        # run first fetch immediately (in background) and schedule recurring
-        hass.async_create_task(_auto_fetch(utcnow()))
-        hass.data[DOMAIN][entry.entry_id]["_auto_fetch_unsub"] = async_track_time_interval(hass, _auto_fetch, timedelta(seconds=interval_seconds))
-
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    stored = hass.data[DOMAIN].get(entry.entry_id, {})
-    unsub = stored.get("_auto_fetch_unsub")
-    if unsub:
-        try:
-            unsub()
-        except Exception:
-            _LOGGER.exception("Failed to unsubscribe auto fetch")
-
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         stored = hass.data[DOMAIN].pop(entry.entry_id, None)
         if stored:
-            # close influx v2 client if exists
-            influx_client = stored.get("_influx_v2_client")
-            try:
-                if influx_client:
-                    influx_client.close()
-            except Exception:
-                _LOGGER.exception("Failed to close Influx v2 client")
-            client = stored.get("client")
-            if client:
-                await client.close()
+            await _async_close_stored(hass, stored)
     return unload_ok
@@ -5,20 +5,45 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 import httpx
 
+# orjson (shipped with Home Assistant) is faster than the stdlib json module
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except Exception:
+    import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# ciso8601 (shipped with Home Assistant) parses ISO 8601 incl. "Z" in C
+try:
+    from ciso8601 import parse_datetime as _parse_iso_fast
+except Exception:
+    _parse_iso_fast = None
+
+# timeout per anrop, gäller även när en delad klient används
+REQUEST_TIMEOUT = 20.0
+
 class MolnusAuthError(Exception):
     """Raised when authentication fails."""
 
 def _parse_iso(dt: Optional[str]) -> Optional[datetime]:
     if not dt:
         return None
-    if dt.endswith("Z"):
-        dt = dt[:-1] + "+00:00"
     try:
+        if _parse_iso_fast is not None:
+            return _parse_iso_fast(dt)
+        if dt.endswith("Z"):
+            dt = dt[:-1] + "+00:00"
         return datetime.fromisoformat(dt)
     except Exception:
         return None
 
-@dataclass
+@dataclass(slots=True)
 class SimplePrediction:
     label: Optional[str]
     accuracy: Optional[int]
@@ -30,24 +55,29 @@ class SimplePrediction:
             accuracy=src.get("accuracy"),
         )
 
-@dataclass
+@dataclass(slots=True)
 class SimpleImage:
     id: Optional[int]
     captureDate: Optional[datetime]
+    captureDateRaw: Optional[str]
     url: Optional[str]
     predictions: List[SimplePrediction]
 
     @classmethod
     def from_dict(cls, src: Dict[str, Any]) -> "SimpleImage":
-        preds = [SimplePrediction.from_dict(p) for p in src.get("ImagePredictions", [])]
+        # bygg prediktionerna direkt (positionellt) i stället för via from_dict per element
+        pred = SimplePrediction
+        preds = [pred(p.get("label"), p.get("accuracy")) for p in src.get("ImagePredictions", ())]
+        raw_date = src.get("captureDate")
         return cls(
             id=src.get("id"),
-            captureDate=_parse_iso(src.get("captureDate")),
+            captureDate=_parse_iso(raw_date),
+            captureDateRaw=raw_date,
             url=src.get("url"),
             predictions=preds,
         )
 
-@dataclass
+@dataclass(slots=True)
 class ImagesResponseSimple:
     success: bool
     images: List[SimpleImage]
@@ -55,7 +85,8 @@ class ImagesResponseSimple:
 
     @classmethod
     def from_dict(cls, src: Dict[str, Any]) -> "ImagesResponseSimple":
-        imgs = [SimpleImage.from_dict(i) for i in src.get("images", [])]
+        image_from_dict = SimpleImage.from_dict
+        imgs = [image_from_dict(i) for i in src.get("images", ())]
         return cls(
             success=bool(src.get("success", False)),
             images=imgs,
@@ -65,10 +96,21 @@ class ImagesResponseSimple:
 class MolnusClient:
     """Enkel async-klient för Molnus (login + get_images)."""
 
-    def __init__(self, email: str, password: str, headers: Optional[Dict[str, str]] = None):
+    def __init__(
+        self,
+        email: str,
+        password: str,
+        headers: Optional[Dict[str, str]] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         self.email = email
         self.password = password
-        self._client = httpx.AsyncClient(timeout=20.0)
+        # använd en delad klient (t.ex. Home Assistants) om den skickas in; den stängs inte av close()
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=5, keepalive_expiry=60),
+        )
         self._token: Optional[str] = None
         self._headers: Dict[str, str] = headers or {
             "accept": "application/json, text/plain, */*",
@@ -76,20 +118,26 @@ class MolnusClient:
             "origin": "https://molnus.com",
             "user-agent": "HomeAssistantMolnusIntegration/0.1"
         }
+        # headers inkl. Authorization, byggs om bara vid (om)inloggning
+        self._auth_headers: Dict[str, str] = {}
 
     async def close(self) -> None:
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
     async def login(self) -> None:
         payload = {"email": self.email, "password": self.password}
-        resp = await self._client.post("https://molnus.com/auth/token", json=payload, headers=self._headers)
+        resp = await self._client.post(
+            "https://molnus.com/auth/token", content=_json_dumps(payload), headers=self._headers, timeout=REQUEST_TIMEOUT
+        )
         if resp.status_code >= 400:
             raise MolnusAuthError(f"Login failed: {resp.status_code} {resp.text}")
-        data = resp.json()
+        data = _json_loads(resp.content)
         token = data.get("access_token") or data.get("token") or data.get("accessToken")
         if not token:
             raise MolnusAuthError("No access_token found in response")
         self._token = token
+        self._auth_headers = {**self._headers, "Authorization": f"Bearer {token}", "accept": "application/json, text/plain, */*"}
 
     async def _ensure_auth(self) -> None:
         if not self._token:
@@ -110,15 +158,13 @@ class MolnusClient:
             "limit": str(limit),
             "wildlifeRequired": "true" if wildlife_required else "false",
         }
-        headers = {**self._headers, "Authorization": f"Bearer {self._token}", "accept": "application/json, text/plain, */*"}
-        resp = await self._client.get("https://molnus.com/images/get", params=params, headers=headers)
+        resp = await self._client.get("https://molnus.com/images/get", params=params, headers=self._auth_headers, timeout=REQUEST_TIMEOUT)
 
         if resp.status_code == 401:
             # försök logga in igen en gång
             await self.login()
-            headers["Authorization"] = f"Bearer {self._token}"
-            resp = await self._client.get("https://molnus.com/images/get", params=params, headers=headers)
+            resp = await self._client.get("https://molnus.com/images/get", params=params, headers=self._auth_headers, timeout=REQUEST_TIMEOUT)
 
         resp.raise_for_status()
-        data = resp.json()
+        data = _json_loads(resp.content)
         return ImagesResponseSimple.from_dict(data)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.helpers.httpx_client import get_async_client
 
 from .const import DOMAIN
 
@@ -40,13 +41,16 @@ class MolnusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Validate credentials by attempting to login
         from .client import MolnusClient, MolnusAuthError
 
-        client = MolnusClient(user_input["email"], user_input["password"])
+        # validate over Home Assistant's shared httpx client instead of a new connection pool
+        client = MolnusClient(user_input["email"], user_input["password"], client=get_async_client(self.hass))
         try:
             await client.login()
         except MolnusAuthError:
             errors["base"] = "auth"
         except Exception:
             errors["base"] = "unknown"
+        finally:
+            await client.close()
 
         if errors:
             return self.async_show_form(step_id="user", data_schema=STEP_USER_DATA, errors=errors)
@@ -3,6 +3,7 @@ from homeassistant.const import Platform
 DOMAIN = "molnus"
 PLATFORMS = [Platform.SENSOR]
 DEFAULT_SCAN_INTERVAL = 3600  # sekunder (1 timme)
+ACTIVE_POLL_DIVISOR = 4  # efter nya bilder hämtas det 4x tätare, sedan glesas det ut till intervallet igen
 AUTH_URL = "https://molnus.com/auth/token"
 IMAGES_URL = "https://molnus.com/images/get"
 STATUS_URL = "https://molnus.com/api/status"  # ändra om endpoint skiljer sig
@@ -16,3 +17,8 @@ LABELS = {
     "MELES": "Grävling (Meles meles)",
     "ALCES": "Älg (Alces alces)",
 }
+
+# Samma labels som frozenset, för snabba mängdoperationer
+LABELS_SET = frozenset(LABELS)
+# (label, översättning)-par, för att skapa sensorerna
+LABELS_ITEMS = tuple(LABELS.items())
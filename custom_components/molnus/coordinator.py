@@ -3,46 +3,67 @@ from __future__ import annotations
 
 import logging
 from datetime import timedelta
-from typing import Any
+from typing import Any, Awaitable, Callable, Optional
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .const import ACTIVE_POLL_DIVISOR
+
 _LOGGER = logging.getLogger(__name__)
 
 
 class MolnusCoordinator(DataUpdateCoordinator):
     """
-    Simple DataUpdateCoordinator for Molnus integration.
+    DataUpdateCoordinator for Molnus integration.
 
-    It will call client's login() on the first refresh (used for validating credentials).
-    You can extend _async_update_data to fetch more state if needed.
+    Each refresh runs update_method (the entry's image fetch + processing, or a
+    login check when no camera is configured) and hands its result to the sensors.
     """
 
-    def __init__(self, hass: HomeAssistant, client: Any, update_interval: int) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        update_interval: Optional[int],
+        update_method: Callable[[], Awaitable[Any]],
+    ) -> None:
         """
         :param hass: Home Assistant instance
-        :param client: instance of MolnusClient
-        :param update_interval: seconds between automatic updates
+        :param update_interval: seconds between automatic updates, None to never poll
+        :param update_method: coroutine function performing one fetch, returns the sensor data
         """
-        self._client = client
+        # configured interval is the slowest we ever poll; after new images we poll faster
+        # and back off towards it again while nothing new arrives
+        self._max_interval = timedelta(seconds=update_interval) if update_interval else None
+        self._min_interval = (
+            max(timedelta(seconds=60), self._max_interval / ACTIVE_POLL_DIVISOR) if self._max_interval else None
+        )
         super().__init__(
             hass,
             _LOGGER,
             name="molnus_coordinator",
-            update_interval=timedelta(seconds=update_interval),
+            update_interval=self._max_interval,
+            update_method=update_method,
         )
 
+    def adjust_interval(self, has_new: bool) -> None:
+        """
+        Drop update_interval to 1/ACTIVE_POLL_DIVISOR of the configured one when a fetch
+        brought new images, otherwise double it, never beyond the configured interval.
+        """
+        if self._max_interval is None:
+            return
+        if has_new:
+            self.update_interval = self._min_interval
+        else:
+            self.update_interval = min(self.update_interval * 2, self._max_interval)
+
     async def _async_update_data(self) -> Any:
         """
-        Perform a single update. We use this to validate credentials / connectivity.
-        You may expand this to return useful status data for other parts of the integration.
+        Perform a single update via update_method.
         """
         try:
-            # Simple connectivity check: ensure we can log in / refresh token
-            await self._client.login()
-            # Return a small status dict (could be expanded)
-            return {"ok": True}
+            return await self.update_method()
         except Exception as err:
             _LOGGER.exception("MolnusCoordinator update failed: %s", err)
             raise UpdateFailed(err)
@@ -1,54 +1,75 @@
 from __future__ import annotations
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.core import callback
-from .const import DOMAIN, LABELS
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from .const import DOMAIN, LABELS_ITEMS
 
 async def async_setup_entry(hass, entry, async_add_entities):
     stored = hass.data[DOMAIN][entry.entry_id]
+    coordinator = stored["coordinator"]
 
-    sensors = []
-    for label, readable in LABELS.items():
-        sensors.append(MolnusLabelCountSensor(entry.entry_id, label, readable))
+    entry_id = entry.entry_id
+    sensors = [
+        MolnusLabelCountSensor(coordinator, entry_id, label, readable)
+        for label, readable in LABELS_ITEMS
+    ]
 
-    # registrera dem i hass.data så de kan uppdateras från service/auto-fetch
-    stored["label_sensors"] = sensors
+    # sensorerna uppdateras via coordinatorn (auto-fetch och tjänsten fetch_images)
     async_add_entities(sensors)
 
-class MolnusLabelCountSensor(SensorEntity):
+class MolnusLabelCountSensor(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = True
 
-    def __init__(self, entry_id: str, label: str, readable_name: str):
-        self._entry_id = entry_id
+    def __init__(self, coordinator, entry_id: str, label: str, readable_name: str):
+        super().__init__(coordinator)
         self._label = label
-        self._readable = readable_name
         self._attr_unique_id = f"molnus_{entry_id}_label_{label}"
         # namnge sensorn med label så det blir unikt i UI; du kan ändra displaynamn i integrationsinställningar
         self._attr_name = f"Molnus {label}"
+        # attributen byggs om vid coordinator-uppdatering, inte vid varje läsning
+        # Exponera användarnamn/översättning och historiken (hela listan)
+        data = coordinator.data
+        self._attrs = {
+            "label": label,
+            "label_name": readable_name,
+            "history": data["history"],
+            "last_images_count": data["last_images_count"],
+        }
+        self._attr_extra_state_attributes = self._attrs
+        self._attr_native_value = self._current_value(data)
+        # tillgänglighet vid senaste skrivning (None = inget skrivet än)
+        self._last_available = None
 
-    @property
-    def native_value(self):
-        hass = self.hass
-        stored = hass.data[DOMAIN].get(self._entry_id, {})
-        counts = stored.get("label_counts", {})
+    def _current_value(self, data: dict) -> int:
         # returnera 1 eller 0
-        val = counts.get(self._label, 0)
+        val = data["label_counts"].get(self._label, 0)
+        if type(val) is int:
+            return val
         try:
             return int(val)
-        except Exception:
+        except (TypeError, ValueError):
             return 0
 
-    @property
-    def extra_state_attributes(self):
-        # Exponera användarnamn/översättning och historiken (hela listan)
-        hass = self.hass
-        stored = hass.data[DOMAIN].get(self._entry_id, {})
-        return {
-            "label": self._label,
-            "label_name": self._readable,
-            "history": stored.get("history", []),
-            "last_images_count": stored.get("last_images_count", 0),
-        }
-
     @callback
     def _handle_coordinator_update(self) -> None:
+        # skriv bara state när värde, attribut eller tillgänglighet faktiskt ändrats
+        # (en misslyckad hämtning lämnar coordinator.data orörd men ändrar available)
+        # historiken är en oföränderlig tuple som bara byts ut vid nya bilder, så identitet räcker
+        data = self.coordinator.data
+        value = self._current_value(data)
+        history = data["history"]
+        images_count = data["last_images_count"]
+        attrs = self._attrs
+        available = self.available
+        if (
+            available == self._last_available
+            and value == self._attr_native_value
+            and images_count == attrs["last_images_count"]
+            and history is attrs["history"]
+        ):
+            return
+        self._last_available = available
+        self._attr_native_value = value
+        attrs["history"] = history
+        attrs["last_images_count"] = images_count
         self.async_write_ha_state()